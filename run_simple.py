@@ -1,8 +1,31 @@
+import os
 import subprocess
 import sys
 
+if os.getenv("ENVIRONMENT") == "production":
+    # One uvicorn worker per core under gunicorn; workers share the listening
+    # socket. WEB_CONCURRENCY overrides the count, since os.cpu_count() sees
+    # the host's cores rather than a container's CPU quota.
+    workers = os.getenv("WEB_CONCURRENCY") or str(os.cpu_count() or 1)
+    print("🚀 Starting Sentiment Analysis API (Simple Version, production)...")
+    result = subprocess.run([
+        sys.executable, "-m", "gunicorn", "src.api.main_simple:app",
+        "-k", "uvicorn.workers.UvicornWorker",
+        "-w", workers,
+        "-b", "0.0.0.0:8000",
+        "--keep-alive", "30",
+    ])
+    sys.exit(result.returncode)
+
 print("🚀 Starting Sentiment Analysis API (Simple Version)...")
 print("📚 API docs will be available at: http://localhost:8000/docs")
 print("Press Ctrl+C to stop\n")
 
-subprocess.run([sys.executable, "-m", "uvicorn", "src.api.main_simple:app", "--reload"])
+# uvloop has no Windows build; uvicorn[standard] skips it there
+loop = "asyncio" if sys.platform == "win32" else "uvloop"
+
+subprocess.run([
+    sys.executable, "-m", "uvicorn", "src.api.main_simple:app", "--reload",
+    "--loop", loop, "--http", "httptools", "--no-access-log",
+    "--timeout-keep-alive", "30",
+])
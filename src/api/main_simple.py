@@ -1,14 +1,18 @@
 # src/api/main_simple.py
 """Simple version that works without ML libraries - Fixed version"""
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List
-from fastapi.responses import Response
+from pydantic import BaseModel, Field, ConfigDict, StringConstraints
+from typing import Annotated, List
+from fastapi.responses import Response, ORJSONResponse
+import functools
+import hashlib
 import time
 import random
 import logging
 import os
+import sys
+import ahocorasick
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -17,7 +21,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Sentiment Analysis API", 
     version="1.0.0",
-    description="Simple mock version for development"
+    description="Simple mock version for development",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS
@@ -28,8 +33,50 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+POSITIVE_WORDS = ['love', 'great', 'awesome', 'excellent', 'amazing', 'wonderful']
+NEGATIVE_WORDS = ['hate', 'terrible', 'awful', 'horrible', 'worst', 'bad']
+
+def _build_automaton():
+    automaton = ahocorasick.Automaton()
+    for word in POSITIVE_WORDS:
+        automaton.add_word(word, "POSITIVE")
+    for word in NEGATIVE_WORDS:
+        automaton.add_word(word, "NEGATIVE")
+    automaton.make_automaton()
+    return automaton
+
+# Built once at import; one C pass over the text finds both keyword classes
+KEYWORDS = _build_automaton()
+
+def _scan_keywords(text: str):
+    found = None
+    for _, sentiment in KEYWORDS.iter(text.lower()):
+        # Positive keywords win over negative ones anywhere in the text
+        if sentiment == "POSITIVE":
+            return sentiment
+        found = sentiment
+    return found
+
+# Keyword matching is deterministic, so short texts are memoized; confidence
+# and the random fallback are still sampled per request in predict(). Long
+# texts bypass the cache: each entry keeps its key alive, and a hit saves
+# little next to the scan itself.
+CACHE_MAX_TEXT_LENGTH = 256
+_cached_scan_keywords = functools.lru_cache(maxsize=8192)(_scan_keywords)
+
+def keyword_sentiment(text: str):
+    """Return the keyword sentiment of a text, or None if no keyword matches"""
+    if len(text) > CACHE_MAX_TEXT_LENGTH:
+        return _scan_keywords(text)
+    return _cached_scan_keywords(text)
+
+# Bound each text so oversized payloads are rejected before lowercasing
+Text = Annotated[str, StringConstraints(max_length=10000)]
+
 class TextRequest(BaseModel):
-    texts: List[str] = Field(..., min_items=1, max_items=10)
+    texts: List[Text] = Field(..., min_length=1, max_length=10)
+
+    model_config = ConfigDict(extra='forbid')
 
 class HealthResponse(BaseModel):
     # Fix Pydantic warnings by using different field names
@@ -40,45 +87,73 @@ class HealthResponse(BaseModel):
     # Disable protected namespace warning
     model_config = ConfigDict(protected_namespaces=())
 
-@app.get("/")
-def root():
-    return {
-        "message": "Sentiment Analysis API",
-        "version": "1.0.0",
-        "endpoints": {
-            "health": "/health",
-            "predict": "/predict",
-            "metrics": "/metrics",
-            "docs": "/docs"
-        }
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.blake2s(body).hexdigest() + '"'
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """True if If-None-Match matches etag (weak comparison, per RFC 9110)"""
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+# Static payloads are serialized once at import and the same response is reused
+ROOT_RESPONSE = ORJSONResponse({
+    "message": "Sentiment Analysis API",
+    "version": "1.0.0",
+    "endpoints": {
+        "health": "/health",
+        "predict": "/predict",
+        "metrics": "/metrics",
+        "docs": "/docs"
     }
+})
+ROOT_HEADERS = {
+    "ETag": _etag(ROOT_RESPONSE.body),
+    "Cache-Control": "public, max-age=3600",
+}
+ROOT_RESPONSE.headers.update(ROOT_HEADERS)
+ROOT_NOT_MODIFIED = Response(status_code=304, headers=ROOT_HEADERS)
+
+@app.get("/")
+async def root(request: Request):
+    if _not_modified(request, ROOT_HEADERS["ETag"]):
+        return ROOT_NOT_MODIFIED
+    return ROOT_RESPONSE
+
+# Returning a response directly skips re-validating against HealthResponse,
+# which still documents the schema in OpenAPI
+HEALTH_RESPONSE = ORJSONResponse({
+    "status": "healthy",
+    "is_model_loaded": True,
+    "version": "mock-model-v1"
+})
 
 @app.get("/health", response_model=HealthResponse)
-def health():
-    return HealthResponse(
-        status="healthy",
-        is_model_loaded=True,
-        version="mock-model-v1"
-    )
+async def health():
+    return HEALTH_RESPONSE
 
 @app.post("/predict")
-def predict(request: TextRequest):
-    start_time = time.time()
-    logger.info(f"Received prediction request for {len(request.texts)} texts")
+async def predict(request: TextRequest) -> ORJSONResponse:
+    start_ns = time.perf_counter_ns()
     
+    # Inline uniform() as lo + span * random() to skip its Python-level frame
+    rand = random.random
+    # One call draws the fallback coin flip for every text in the batch
+    flips = random.getrandbits(len(request.texts))
     predictions = []
-    for text in request.texts:
+    for i, text in enumerate(request.texts):
         # Simple rule-based sentiment
-        text_lower = text.lower()
-        if any(word in text_lower for word in ['love', 'great', 'awesome', 'excellent', 'amazing', 'wonderful']):
-            sentiment = "POSITIVE"
-            confidence = random.uniform(0.85, 0.99)
-        elif any(word in text_lower for word in ['hate', 'terrible', 'awful', 'horrible', 'worst', 'bad']):
-            sentiment = "NEGATIVE"
-            confidence = random.uniform(0.85, 0.99)
+        sentiment = keyword_sentiment(text)
+        if sentiment is not None:
+            confidence = 0.85 + 0.14 * rand()
         else:
-            sentiment = random.choice(["POSITIVE", "NEGATIVE"])
-            confidence = random.uniform(0.50, 0.75)
+            sentiment = "POSITIVE" if flips >> i & 1 else "NEGATIVE"
+            confidence = 0.50 + 0.25 * rand()
         
         predictions.append({
             "text": text[:100] + "..." if len(text) > 100 else text,
@@ -87,19 +162,19 @@ def predict(request: TextRequest):
             "model_version": "mock-model-v1"
         })
     
-    processing_time = time.time() - start_time
-    logger.info(f"Processed {len(predictions)} predictions in {processing_time:.3f}s")
+    # Whole milliseconds in integer math; the response reports seconds
+    processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000 / 1000
+    # Lazy %-formatting: nothing is formatted unless DEBUG is enabled
+    logger.debug("Processed %d predictions in %.3fs", len(predictions), processing_time)
     
-    return {
+    return ORJSONResponse({
         "predictions": predictions,
         "count": len(predictions),
-        "processing_time": round(processing_time, 3)
-    }
+        "processing_time": processing_time
+    })
 
-@app.get("/metrics", response_class=Response)
-def metrics():
-    # Mock Prometheus metrics
-    metrics_data = """# HELP sentiment_predictions_total Total predictions made
+# Mock Prometheus metrics
+METRICS_BYTES = b"""# HELP sentiment_predictions_total Total predictions made
 # TYPE sentiment_predictions_total counter
 sentiment_predictions_total{status="success"} 42
 sentiment_predictions_total{status="error"} 0
@@ -116,10 +191,30 @@ sentiment_prediction_duration_seconds_sum 8.5
 # TYPE sentiment_active_requests gauge
 sentiment_active_requests 0
 """
-    return Response(content=metrics_data, media_type="text/plain")
+# no-cache: scrapers must revalidate every time, but an unchanged body costs a 304
+METRICS_HEADERS = {"ETag": _etag(METRICS_BYTES), "Cache-Control": "no-cache"}
+METRICS_RESPONSE = Response(
+    content=METRICS_BYTES, media_type="text/plain", headers=METRICS_HEADERS
+)
+METRICS_NOT_MODIFIED = Response(status_code=304, headers=METRICS_HEADERS)
+
+@app.get("/metrics", response_class=Response)
+async def metrics(request: Request):
+    if _not_modified(request, METRICS_HEADERS["ETag"]):
+        return METRICS_NOT_MODIFIED
+    return METRICS_RESPONSE
 
 # Don't run uvicorn here if imported as module
 if __name__ == "__main__":
     import uvicorn
     # Use string import for proper reloading
-    uvicorn.run("src.api.main_simple:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run(
+        "src.api.main_simple:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        access_log=False,
+        timeout_keep_alive=30,
+    )
\ No newline at end of file
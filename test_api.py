@@ -3,11 +3,14 @@ import json
 
 BASE_URL = "http://localhost:8000"
 
+# Reuse one keep-alive connection for all calls
+session = requests.Session()
+
 print("🧪 Testing Sentiment Analysis API...")
 
 # Test health endpoint
 try:
-    response = requests.get(f"{BASE_URL}/health")
+    response = session.get(f"{BASE_URL}/health")
     print(f"✓ Health check: {response.json()}")
 except Exception as e:
     print(f"✗ Health check failed: {e}")
@@ -23,7 +26,7 @@ test_data = {
     ]
 }
 
-response = requests.post(f"{BASE_URL}/predict", json=test_data)
+response = session.post(f"{BASE_URL}/predict", json=test_data)
 if response.status_code == 200:
     print(f"✓ Prediction successful:")
     for pred in response.json()["predictions"]:
@@ -11,14 +11,17 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from src.api.main_simple import app
 
-# Create test client
-client = TestClient(app)
+@pytest.fixture(scope="session")
+def client():
+    """Share one TestClient (and its running app) across all tests"""
+    with TestClient(app) as c:
+        yield c
 
 
 class TestHealthEndpoints:
     """Test health and status endpoints"""
     
-    def test_root_endpoint(self):
+    def test_root_endpoint(self, client):
         """Test root endpoint returns API information"""
         response = client.get("/")
         assert response.status_code == 200
@@ -27,7 +30,30 @@ class TestHealthEndpoints:
         assert "endpoints" in data
         assert all(endpoint in data["endpoints"] for endpoint in ["health", "predict", "metrics", "docs"])
     
-    def test_health_endpoint(self):
+    def test_root_endpoint_etag(self, client):
+        """Test root endpoint answers 304 when the ETag matches"""
+        response = client.get("/")
+        etag = response.headers["etag"]
+        assert "max-age" in response.headers["cache-control"]
+        
+        response = client.get("/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+    
+    def test_root_endpoint_etag_wildcard_and_list(self, client):
+        """Test If-None-Match matches on * and within a list of tags"""
+        etag = client.get("/").headers["etag"]
+        
+        response = client.get("/", headers={"If-None-Match": "*"})
+        assert response.status_code == 304
+        
+        response = client.get("/", headers={"If-None-Match": f'"other", W/{etag}'})
+        assert response.status_code == 304
+        
+        response = client.get("/", headers={"If-None-Match": f'"x{etag[1:]}'})
+        assert response.status_code == 200
+    
+    def test_health_endpoint(self, client):
         """Test health check endpoint"""
         response = client.get("/health")
         assert response.status_code == 200
@@ -40,7 +66,7 @@ class TestHealthEndpoints:
 class TestPredictionEndpoint:
     """Test prediction functionality"""
     
-    def test_single_prediction(self):
+    def test_single_prediction(self, client):
         """Test prediction with single text"""
         response = client.post(
             "/predict",
@@ -53,7 +79,7 @@ class TestPredictionEndpoint:
         assert data["predictions"][0]["sentiment"] in ["POSITIVE", "NEGATIVE"]
         assert 0 <= data["predictions"][0]["confidence"] <= 1
     
-    def test_multiple_predictions(self):
+    def test_multiple_predictions(self, client):
         """Test prediction with multiple texts"""
         texts = [
             "This is amazing!",
@@ -66,7 +92,7 @@ class TestPredictionEndpoint:
         assert data["count"] == 3
         assert len(data["predictions"]) == 3
     
-    def test_positive_sentiment_detection(self):
+    def test_positive_sentiment_detection(self, client):
         """Test that positive words return positive sentiment"""
         positive_texts = [
             "I love this!",
@@ -81,7 +107,7 @@ class TestPredictionEndpoint:
         positive_count = sum(1 for p in data["predictions"] if p["sentiment"] == "POSITIVE")
         assert positive_count >= 3
     
-    def test_negative_sentiment_detection(self):
+    def test_negative_sentiment_detection(self, client):
         """Test that negative words return negative sentiment"""
         negative_texts = [
             "I hate this",
@@ -95,29 +121,55 @@ class TestPredictionEndpoint:
         # At least 3 out of 4 should be detected as negative
         negative_count = sum(1 for p in data["predictions"] if p["sentiment"] == "NEGATIVE")
         assert negative_count >= 3
+
+    def test_positive_keyword_wins_over_negative(self, client):
+        """Test that a positive keyword takes precedence over a negative one"""
+        response = client.post(
+            "/predict",
+            json={"texts": ["Bad start, but I love the ending"]}
+        )
+        data = response.json()
+        assert data["predictions"][0]["sentiment"] == "POSITIVE"
+
+    def test_long_text_sentiment_detection(self, client):
+        """Test that texts too long to be cached are still classified"""
+        long_text = "Nothing to see here. " * 20 + "But the ending was awful"
+        response = client.post("/predict", json={"texts": [long_text]})
+        data = response.json()
+        assert data["predictions"][0]["sentiment"] == "NEGATIVE"
     
-    def test_empty_text_list(self):
+    def test_empty_text_list(self, client):
         """Test that empty text list returns validation error"""
         response = client.post("/predict", json={"texts": []})
         assert response.status_code == 422
     
-    def test_too_many_texts(self):
+    def test_too_many_texts(self, client):
         """Test that too many texts returns validation error"""
         texts = ["sample text"] * 11  # Max is 10
         response = client.post("/predict", json={"texts": texts})
         assert response.status_code == 422
     
-    def test_invalid_input_type(self):
+    def test_invalid_input_type(self, client):
         """Test that invalid input type returns error"""
         response = client.post("/predict", json={"texts": "not a list"})
         assert response.status_code == 422
     
-    def test_missing_texts_field(self):
+    def test_text_too_long(self, client):
+        """Test that an oversized text returns validation error"""
+        response = client.post("/predict", json={"texts": ["a" * 10001]})
+        assert response.status_code == 422
+    
+    def test_unknown_field(self, client):
+        """Test that unknown request fields return validation error"""
+        response = client.post("/predict", json={"texts": ["Test"], "extra": 1})
+        assert response.status_code == 422
+    
+    def test_missing_texts_field(self, client):
         """Test that missing texts field returns error"""
         response = client.post("/predict", json={})
         assert response.status_code == 422
     
-    def test_response_structure(self):
+    def test_response_structure(self, client):
         """Test that response has correct structure"""
         response = client.post(
             "/predict",
@@ -141,7 +193,7 @@ class TestPredictionEndpoint:
 class TestMetricsEndpoint:
     """Test metrics endpoint"""
     
-    def test_metrics_endpoint(self):
+    def test_metrics_endpoint(self, client):
         """Test that metrics endpoint returns Prometheus format"""
         response = client.get("/metrics")
         assert response.status_code == 200
@@ -152,12 +204,23 @@ class TestMetricsEndpoint:
         assert "# HELP" in content
         assert "# TYPE" in content
         assert "sentiment_predictions_total" in content
+    
+    def test_metrics_endpoint_etag(self, client):
+        """Test metrics endpoint answers 304 only when the ETag matches"""
+        etag = client.get("/metrics").headers["etag"]
+        
+        response = client.get("/metrics", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        
+        response = client.get("/metrics", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert "sentiment_predictions_total" in response.text
 
 
 class TestEdgeCases:
     """Test edge cases and error handling"""
     
-    def test_long_text_truncation(self):
+    def test_long_text_truncation(self, client):
         """Test that long texts are truncated in response"""
         long_text = "This is a very long text. " * 50
         response = client.post("/predict", json={"texts": [long_text]})
@@ -167,7 +230,7 @@ class TestEdgeCases:
         assert len(returned_text) == 103  # 100 chars + "..."
         assert returned_text.endswith("...")
     
-    def test_special_characters(self):
+    def test_special_characters(self, client):
         """Test handling of special characters"""
         special_texts = [
             "Great! 😊",
@@ -182,14 +245,17 @@ class TestEdgeCases:
     
     def test_concurrent_requests(self):
         """Test API handles concurrent requests"""
-        import concurrent.futures
+        import asyncio
+        import httpx
         
-        def make_request():
-            return client.post("/predict", json={"texts": ["Test"]})
+        async def make_requests():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+                return await asyncio.gather(
+                    *[ac.post("/predict", json={"texts": ["Test"]}) for _ in range(10)]
+                )
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(make_request) for _ in range(10)]
-            results = [f.result() for f in concurrent.futures.as_completed(futures)]
+        results = asyncio.run(make_requests())
         
         assert all(r.status_code == 200 for r in results)
 
@@ -198,7 +264,7 @@ class TestEdgeCases:
 class TestPerformance:
     """Test API performance"""
     
-    def test_response_time(self):
+    def test_response_time(self, client):
         """Test that API responds within acceptable time"""
         import time
         
@@ -209,7 +275,7 @@ class TestPerformance:
         assert response.status_code == 200
         assert duration < 1.0  # Should respond within 1 second
     
-    def test_processing_time_in_response(self):
+    def test_processing_time_in_response(self, client):
         """Test that processing time is included and reasonable"""
         response = client.post("/predict", json={"texts": ["Test"] * 5})
         data = response.json()
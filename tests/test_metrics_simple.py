@@ -0,0 +1,44 @@
+# tests/test_metrics_simple.py
+"""Tests for the simple in-process metrics counters"""
+import threading
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.monitoring import metrics_simple
+
+
+class TestConcurrentTracking:
+    """Test counters stay exact under concurrent updates"""
+    
+    def test_concurrent_updates(self, monkeypatch):
+        """Test N threads x M calls produce exact totals"""
+        monkeypatch.setattr(
+            metrics_simple, "prediction_count", {"success": 0, "error": 0}
+        )
+        monkeypatch.setattr(metrics_simple, "request_count", 0)
+        monkeypatch.setattr(metrics_simple, "total_duration_ns", 0)
+        threads_count, calls = 8, 500
+        
+        def worker():
+            for _ in range(calls):
+                with metrics_simple.track_prediction_duration():
+                    metrics_simple.track_prediction_request(2)
+                    metrics_simple.track_prediction_request(1, status="error")
+        
+        threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        content = metrics_simple.get_metrics()
+        total = threads_count * calls
+        success_line = f'sentiment_predictions_total{{status="success"}} {2 * total}\n'
+        error_line = f'sentiment_predictions_total{{status="error"}} {total}\n'
+        assert success_line in content
+        assert error_line in content
+        assert metrics_simple.request_count == total
+        assert metrics_simple.total_duration_ns > 0